@@ -13,7 +13,248 @@ import plotly.graph_objects as go
 import string
 import json
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba_array
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
 import numpy as np
+import csv
+import io
+import os
+import random
+import time
+
+from parsnip_normalize import Normalizer
+
+# Line charts keep at most one point per this many horizontal pixels; extra documents are binned
+PIXELS_PER_POINT = 2
+
+# Most x-axis tick labels a line chart will draw
+MAX_TICK_LABELS = 30
+
+# Most entries a chart legend will list before summarizing the rest
+MAX_LEGEND_ENTRIES = 30
+
+# Bump whenever a native parser's output changes, so cached parser output is discarded
+PARSER_VERSION = 1
+
+# Plain text files are read in chunks of this many bytes
+CHUNK_SIZE = 1 << 20
+
+# Byte-order marks that identify encodings a chunked UTF-8/ASCII reader can't handle
+_WIDE_BOMS = {
+    b"\xff\xfe\x00\x00": "utf-32",
+    b"\x00\x00\xfe\xff": "utf-32",
+    b"\xff\xfe": "utf-16",
+    b"\xfe\xff": "utf-16",
+}
+
+# Cleaning table for ASCII bytes: lowercase A-Z, and map the control characters that
+# str.split() treats as whitespace to spaces so bytes.split() tokenizes identically
+_ASCII_TABLE = bytes.maketrans(
+    string.ascii_uppercase.encode() + b"\x1c\x1d\x1e\x1f",
+    string.ascii_lowercase.encode() + b"    ",
+)
+_PUNCTUATION_BYTES = string.punctuation.encode()
+_PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+
+
+def _count_text_chunks(chunks):
+    """
+    Count words in chunks of raw bytes, each ending on a whitespace boundary.
+
+    ASCII chunks are cleaned and split as bytes without ever being decoded; only
+    chunks containing non-ASCII bytes are decoded (as UTF-8, skipping bytes that
+    aren't valid). Bytes keys are decoded once per unique word at the end.
+
+    Args:
+        chunks: Iterable of bytes
+
+    Returns:
+        Tuple of (wordcount Counter, numwords)
+    """
+    byte_counts = Counter()
+    wordcount = Counter()
+    numwords = 0
+
+    for chunk in chunks:
+        if chunk.isascii():
+            words = chunk.translate(_ASCII_TABLE, _PUNCTUATION_BYTES).split()
+            byte_counts.update(words)
+        else:
+            text = chunk.decode("utf-8", errors="ignore").lower()
+            words = text.translate(_PUNCTUATION_TABLE).split()
+            wordcount.update(words)
+        numwords += len(words)
+
+    for word, count in byte_counts.items():
+        wordcount[word.decode("ascii")] += count
+    return wordcount, numwords
+
+
+def _read_text_chunks(file):
+    """
+    Yield CHUNK_SIZE-ish pieces of a binary file, cut at the last ASCII whitespace
+    so no word is split across two chunks.
+    Whitespace bytes never occur inside a UTF-8 multi-byte character, so this is also safe for UTF-8.
+    """
+    carry = b""
+    while True:
+        block = file.read(CHUNK_SIZE)
+        if not block:
+            break
+        block = carry + block
+        cut = max(block.rfind(b" "), block.rfind(b"\n"), block.rfind(b"\t"), block.rfind(b"\r"))
+        if cut < 0:
+            carry = block
+            continue
+        carry = block[cut + 1:]
+        yield block[:cut + 1]
+    if carry:
+        yield carry
+
+
+# ==== Preview sampling
+
+# Default budgets for preview mode (see Parsnip.load_text)
+PREVIEW_BYTES = 8 << 20
+PREVIEW_SECONDS = 1.0
+
+# Size of each randomly placed chunk read in preview mode
+SAMPLE_CHUNK_SIZE = 64 << 10
+
+
+def _last_index(block, separators):
+    """Index of the last occurrence of any separator byte in block, or -1"""
+    return max(block.rfind(sep) for sep in separators)
+
+
+def _first_index(block, separators):
+    """Index of the first occurrence of any separator byte in block, or -1"""
+    found = [i for i in (block.find(sep) for sep in separators) if i >= 0]
+    return min(found) if found else -1
+
+
+def _sample_chunks(file, sample, start=0, separators=(b" ", b"\n", b"\t", b"\r")):
+    """
+    Stratified random sample of byte chunks from a binary file.
+
+    The file (from start) is split into equal strata, one chunk is read at a random
+    offset in each, and partial records at either end of a chunk are dropped so chunks
+    start and end on a separator. Strata are visited in random order, so stopping early
+    on the time budget still leaves a sample spread over the whole file.
+
+    Args:
+        file: File opened in binary mode
+        sample (dict): Preview settings with "byte_budget", "time_budget" and "seed"
+        start (int): Offset where sampling starts (e.g. after a CSV header)
+        separators: Bytes that may separate records (words or lines)
+
+    Returns:
+        Tuple of (list of (offset, chunk) pairs, fraction of the file they cover), where
+        offset is where the chunk starts relative to start. If the whole file fits in the
+        byte budget it is read entirely as one chunk at offset 0 and the fraction is 1.0
+    """
+    file.seek(0, 2)
+    size = file.tell() - start
+    budget = sample.get("byte_budget", PREVIEW_BYTES)
+    if size <= budget:
+        file.seek(start)
+        return [(0, file.read())], 1.0
+
+    rng = random.Random(sample.get("seed"))
+    deadline = time.perf_counter() + sample.get("time_budget", PREVIEW_SECONDS)
+    num_strata = max(1, budget // SAMPLE_CHUNK_SIZE)
+    stratum = size // num_strata
+    chunk_size = min(SAMPLE_CHUNK_SIZE, stratum)
+
+    chunks = []
+    covered = 0
+    for index in rng.sample(range(num_strata), num_strata):
+        if chunks and time.perf_counter() > deadline:
+            break
+        offset = index * stratum + rng.randrange(max(1, stratum - chunk_size + 1))
+        file.seek(start + offset)
+        block = file.read(chunk_size)
+
+        # Drop the partial record at each end unless it's the start/end of the file
+        head = 0 if offset == 0 else _first_index(block, separators) + 1
+        tail = len(block) if offset + len(block) >= size else _last_index(block, separators) + 1
+        if offset > 0 and head == 0:
+            # No separator at all: the whole chunk is inside one record
+            continue
+        if head < tail:
+            chunks.append((offset + head, block[head:tail]))
+            covered += tail - head
+
+    # Only the bytes actually tokenized count towards the sampled fraction
+    return chunks, max(covered, 1) / size
+
+
+def _sampled_csv_rows(chunks, fieldnames):
+    """
+    Rows of sampled CSV chunks as dictionaries, with the number of bytes each row spans.
+
+    A chunk that starts in the middle of the file can start at a newline inside a quoted
+    field, so its first row is discarded to resync on a real record boundary. Rows with
+    the wrong number of fields are skipped. Only kept rows report their bytes, so the
+    sampled fraction can be computed from what was actually counted.
+
+    Args:
+        chunks: (offset, chunk) pairs from _sample_chunks, each chunk ending on a newline
+        fieldnames (list): Column names from the CSV header
+
+    Yields:
+        Tuple of (dictionary of column name -> value, bytes spanned by the row)
+    """
+    for offset, chunk in chunks:
+        consumed = 0
+
+        def lines():
+            nonlocal consumed
+            for line in chunk.splitlines(keepends=True):
+                consumed += len(line)
+                yield line.decode("utf-8", errors="ignore")
+
+        rows = csv.reader(lines())
+        try:
+            if offset > 0:
+                next(rows, None)
+            previous = consumed
+            for row in rows:
+                nbytes, previous = consumed - previous, consumed
+                if len(row) == len(fieldnames):
+                    yield dict(zip(fieldnames, row)), nbytes
+        except csv.Error:
+            # A quoted field left open where the chunk was cut: the rest of it is unusable
+            continue
+
+
+def _estimate_note(fraction):
+    """Suffix for parser log lines when counts are estimated from a sample"""
+    return "" if fraction >= 1.0 else f" (estimated from a {fraction:.1%} sample)"
+
+
+def _scale_results(results, fraction):
+    """
+    Scale sampled counts up to estimates for the whole document and mark them approximate
+
+    Args:
+        results (dict): Parser results with wordcount and numwords from a sample
+        fraction (float): Fraction of the document the sample covers
+
+    Returns:
+        The same results dictionary, updated in place
+    """
+    if fraction >= 1.0:
+        return results
+    results["wordcount"] = Counter(
+        {word: max(1, round(count / fraction)) for word, count in results["wordcount"].items()}
+    )
+    results["numwords"] = round(results["numwords"] / fraction)
+    results["approximate"] = True
+    results["sample_fraction"] = fraction
+    return results
 
 
 class Parsnip:
@@ -26,6 +267,10 @@ class Parsnip:
         """Constructor to initialize state"""
         self.data = defaultdict(dict)
         self.stop_words = []
+        # Optional Normalizer (stemming, lemmatization, ...) applied to every document
+        self.normalizer = None
+        # Bumped whenever documents change, so cached query results can be invalidated
+        self.version = 0
 
     # === Data Init
 
@@ -40,7 +285,23 @@ class Parsnip:
             dirty = file.readlines()
             self.stop_words = [word.replace("\n", "") for word in dirty]
 
-    def load_text(self, filename, label=None, parser=None):
+    def set_normalizer(self, method="stem", mapping=None, cache_size=100_000):
+        """
+        Normalize words of every document loaded from now on, whatever its parser.
+        Stop words are removed first, then counts of words with the same normal form are merged.
+
+        Args:
+            method: "stem", "lemma", "mapping", a custom function, a Normalizer, or None to disable
+            mapping (dict): Word -> normalized word, used when method is "mapping"
+            cache_size (int): Max number of words kept in the LRU cache
+        """
+        if method is None or isinstance(method, Normalizer):
+            self.normalizer = method
+        else:
+            self.normalizer = Normalizer(method, mapping, cache_size)
+
+    def load_text(self, filename, label=None, parser=None, preview=False,
+                  byte_budget=PREVIEW_BYTES, time_budget=PREVIEW_SECONDS, seed=None):
         """
         Register a text document with the framework.
         Extract and store data to be used later in our visualizations.
@@ -49,9 +310,19 @@ class Parsnip:
             filename (str): Path to the file to load
             label: Optional label for identifying the text in visualizations
             parser: Optional custom parser function. If None, use_default_parser
+            preview (bool): Parse only a random sample of the file and scale the counts up.
+                The parser is called with a `sample` keyword, which custom parsers must accept.
+                Sampled documents are marked approximate and charts label them as estimated
+            byte_budget (int): Max bytes to read in preview mode (default: 8 MiB)
+            time_budget (float): Max seconds to spend reading in preview mode (default: 1.0)
+            seed: Optional random seed for a reproducible preview sample
         """
         if parser is None:
-            results = self.default_parser(filename)
+            parser = self.default_parser
+
+        if preview:
+            sample = {"byte_budget": byte_budget, "time_budget": time_budget, "seed": seed}
+            results = parser(filename, sample=sample)
         else:
             results = parser(filename)
 
@@ -59,57 +330,75 @@ class Parsnip:
         if label is None:
             label = filename
 
+        # Remove stop words, then merge counts of words that share a normalized form
+        # (stem, lemma, ...). Done before storing so a failure leaves self.data untouched
+        if "wordcount" in results:
+            wordcount = results["wordcount"]
+            if self.stop_words:
+                filtered = Counter()
+                for word, count in wordcount.items():
+                    if word not in self.stop_words:
+                        filtered[word] = count
+                wordcount = filtered
+            if self.normalizer is not None:
+                wordcount = self.normalizer.normalize_counts(wordcount)
+            results = {**results, "wordcount": wordcount}
+
         # Store the results for that ONE document into self.data
         for k, v in results.items():
             self.data[k][label] = v
 
-        # Remove stop words from wordcount
-        if self.stop_words and "wordcount" in results:
-            filtered = Counter()
-            for word, count in results["wordcount"].items():
-                if word not in self.stop_words:
-                    filtered[word] = count
-            self.data["wordcount"][label] = filtered
+        self.version += 1
 
     # ==== Native Parsers
 
     @staticmethod
-    def default_parser(filename):
+    def default_parser(filename, sample=None):
         """
-        Default parser for processing plain text file (txt)
+        Default parser for processing plain text file (txt).
+        ASCII text is tokenized directly on bytes; other text is decoded as UTF-8
+        (or UTF-16/32 when the file has a byte-order mark), skipping undecodable bytes.
 
         Args:
             filename (str): Path to plain text file
+            sample (dict): Optional preview settings; only random chunks of the file are read
 
         Returns:
             Dictionary containing wordcount and numwords
         """
-        with open(filename, "r", encoding="utf-8") as file:
-            text = file.read()
+        with open(filename, "rb") as file:
+            head = file.read(4)
+            encoding = next(
+                (enc for bom, enc in _WIDE_BOMS.items() if head.startswith(bom)), None
+            )
 
-        # Clean the text: lowercase and remove punctuation
-        text = text.lower()
-        text = text.translate(str.maketrans("", "", string.punctuation))
+            fraction = 1.0
+            if encoding is not None:
+                # UTF-16/32 text can't be processed bytewise: decode it all, skipping bad bytes
+                text = (head + file.read()).decode(encoding, errors="ignore")
+                chunks = [text.encode("utf-8")]
+            elif sample is not None:
+                start = 3 if head.startswith(b"\xef\xbb\xbf") else 0
+                chunks, fraction = _sample_chunks(file, sample, start)
+                chunks = [chunk for _, chunk in chunks]
+            else:
+                # Skip a UTF-8 byte-order mark, then stream the file in chunks
+                file.seek(3 if head.startswith(b"\xef\xbb\xbf") else 0)
+                chunks = _read_text_chunks(file)
 
-        # Split into words
-        words = text.split()
+            # Clean (lowercase, remove punctuation), split and count words
+            wordcount, numwords = _count_text_chunks(chunks)
 
-        # Count words
-        wordcount = Counter(words)
-        numwords = len(words)
+        results = _scale_results({"wordcount": wordcount, "numwords": numwords}, fraction)
 
-        results = {
-            "wordcount": wordcount,
-            "numwords": numwords,
-        }
-
-        print(f"Parsed {filename}: {numwords} words")
+        print(f"Parsed {filename}: {results['numwords']} words" + _estimate_note(fraction))
         return results
 
-    def pdf_parser(self, filename):
+    def pdf_parser(self, filename, sample=None):
         """
         Custom parser for PDF files.
         Extracts text from PDF and processes it.
+        With preview sample settings, only a stratified random sample of pages is extracted.
         """
         try:
             import PyPDF2
@@ -122,9 +411,13 @@ class Parsnip:
 
         with open(filename, "rb") as file:
             pdf_reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text()
+            fraction = 1.0
+            if sample is not None:
+                text, fraction = self._sample_page_text(file, pdf_reader.pages, sample)
+            else:
+                text = ""
+                for page in pdf_reader.pages:
+                    text += page.extract_text()
 
         # Clean the text: lowercase and remove punctuation
         text = text.lower()
@@ -134,30 +427,74 @@ class Parsnip:
         wordcount = Counter(words)
         numwords = len(words)
 
-        results = {
-            "wordcount": wordcount,
-            "numwords": numwords,
-        }
+        results = _scale_results({"wordcount": wordcount, "numwords": numwords}, fraction)
 
-        print(f"Parsed {filename}: {numwords} words")
+        print(f"Parsed {filename}: {results['numwords']} words" + _estimate_note(fraction))
         return results
 
-    def csv_parser(self, filename, text_column="text"):
+    @staticmethod
+    def _sample_page_text(file, pages, sample):
+        """
+        Extract text from a stratified random sample of PDF pages within the preview budgets.
+        The byte budget is converted to a page count using the file's average bytes per page.
+
+        Returns:
+            Tuple of (extracted text, fraction of the pages sampled)
+        """
+        total = len(pages)
+        if total == 0:
+            return "", 1.0
+        file.seek(0, 2)
+        bytes_per_page = max(1, file.tell() // max(1, total))
+        num_strata = min(total, max(1, sample.get("byte_budget", PREVIEW_BYTES) // bytes_per_page))
+
+        rng = random.Random(sample.get("seed"))
+        deadline = time.perf_counter() + sample.get("time_budget", PREVIEW_SECONDS)
+
+        text = ""
+        sampled = 0
+        for index in rng.sample(range(num_strata), num_strata):
+            # Extraction is the slow part, so the time budget is checked per page
+            if sampled and time.perf_counter() > deadline:
+                break
+            first = index * total // num_strata
+            last = (index + 1) * total // num_strata
+            text += pages[rng.randrange(first, last)].extract_text() + " "
+            sampled += 1
+        return text, sampled / total
+
+    def csv_parser(self, filename, text_column="text", sample=None):
         """
         Custom parser for CSV files
         Extracts and analyzes text from a specified column
+        With preview sample settings, only rows from random chunks of the file are read.
         """
 
-        import csv
-
         text_data = []
+        fraction = 1.0
 
         with open(filename, "r", encoding="utf-8") as file:
             reader = csv.DictReader(file)
 
+            if sample is not None:
+                # Rows are sampled from random byte ranges after the header line
+                header = reader.fieldnames or []
+                with open(filename, "rb") as raw:
+                    start = len(raw.readline())
+                    body_size = os.fstat(raw.fileno()).st_size - start
+                    chunks, fraction = _sample_chunks(raw, sample, start, separators=(b"\n",))
+                sampled = list(_sampled_csv_rows(chunks, header))
+                reader = [row for row, _ in sampled]
+
+                # Scale by the bytes of rows actually kept, not every byte read
+                if fraction < 1.0:
+                    fraction = max(1, sum(nbytes for _, nbytes in sampled)) / body_size
+
             for row in reader:
                 if text_column in row:
-                    text_data.append(row[text_column])
+                    # Short rows leave missing columns as None
+                    if row[text_column] is not None:
+                        text_data.append(row[text_column])
 
                 elif not text_data:
                     for col_name in [
@@ -168,7 +505,8 @@ class Parsnip:
                         "description",
                     ]:
                         if col_name in row:
-                            text_data.append(row[col_name])
+                            if row[col_name] is not None:
+                                text_data.append(row[col_name])
                             break
 
         text = " ".join(text_data)
@@ -182,16 +520,13 @@ class Parsnip:
         wordcount = Counter(words)
         numwords = len(words)
 
-        results = {
-            "wordcount": wordcount,
-            "numwords": numwords,
-        }
+        results = _scale_results({"wordcount": wordcount, "numwords": numwords}, fraction)
 
-        print(f"Parsed {filename}: {numwords} words")
+        print(f"Parsed {filename}: {results['numwords']} words" + _estimate_note(fraction))
         return results
 
 
-    def json_parser(self, filename, text_key="text"):
+    def json_parser(self, filename, text_key="text", sample=None):
         """
         Custom parser for JSON files
         Expects JSON with a text field
@@ -199,6 +534,7 @@ class Parsnip:
         Args:
             filename (str): Path to JSON file
             text_key (str): Key in JSON containing text (default: "text")
+            sample (dict): Ignored; a JSON document must be read whole, so previews are exact
 
         Returns:
             Dictionary containing wordcount and numwords
@@ -233,27 +569,43 @@ class Parsnip:
             print(f"Error parsing {filename}: {e}")
             return {"wordcount": Counter(), "numwords": 0}
 
-    # ==== Visualization
+    # ==== Chart Data
 
-    def word_frequency_bars(self, word_list=None, top_n=10, title=None):
+    def top_words(self, k=10):
         """
-        Create a grid of horizontal bar charts showing top N most frequent words for each document.
+        Top k most common words across the combined corpus
 
         Args:
-            word_list: Optional list of specific words to display. If None, shows top_n words
-            top_n: Number of top words to display for each document (default: 10)
-            title: Custom title for the overall figure (default: generic title based on top_n)
+            k: Number of words to return (default: 10)
+
+        Returns:
+            List of words, most common first
         """
-        wordcounts = self.data["wordcount"]
-        num_docs = len(wordcounts)
-        cols = int(np.ceil(np.sqrt(num_docs)))
-        rows = int(np.ceil(num_docs / cols))
-        fig, axes = plt.subplots(rows, cols, figsize=(5 * cols, 4 * rows))
-        if num_docs == 1:
-            axes = [axes]
-        else:
-            axes = axes.flatten()
-        for index, (label, counter) in enumerate(wordcounts.items()):
+        combined_counter = Counter()
+        for counter in self.data["wordcount"].values():
+            combined_counter.update(counter)
+        return [word for word, count in combined_counter.most_common(k)]
+
+    def _query_words(self, word_list):
+        """Normalize a caller's word list like the stored counts, so "customers" finds "customer" """
+        if word_list is None or self.normalizer is None:
+            return word_list
+        return self.normalizer.normalize_words(word_list)
+
+    def frequency_data(self, word_list=None, top_n=10):
+        """
+        Data behind word_frequency_bars: the words and counts shown for each document
+
+        Args:
+            word_list: Optional list of specific words. If None, uses each document's top_n words
+            top_n: Number of top words per document if word_list is None
+
+        Returns:
+            Dictionary of label -> {"words": [...], "counts": [...]}
+        """
+        word_list = self._query_words(word_list)
+        data = {}
+        for label, counter in self.data["wordcount"].items():
             # If word_list is provided, use it; otherwise get top_n words
             if word_list is not None:
 
@@ -264,40 +616,29 @@ class Parsnip:
                 top_words = counter.most_common(top_n)
                 words = [word for word, count in top_words]
                 count = [count for word, count in top_words]
+            data[label] = {"words": words, "counts": count}
+        return data
 
-            axes[index].barh(words, count)
-            axes[index].set_title(label)
-            axes[index].set_xlabel("Frequency")
-            axes[index].invert_yaxis()
-        for index in range(num_docs, len(axes)):
-            axes[index].set_visible(False)
-
-        # Use custom title if provided, otherwise use default
-        if title is None:
-            title = f"Top {top_n} Most Frequent Words Across Documents"
-        plt.suptitle(title)
-        plt.tight_layout()
-        plt.show()
-
-    def wordcount_sankey(self, word_list=None, k=5, title="Text to Word Flow Analysis"):
+    def sankey_data(self, word_list=None, k=5):
         """
-        Create a Sankey diagram mapping texts to words
+        Data behind wordcount_sankey: nodes and text -> word links
 
         Args:
-            word_list: Optional list of  specific words to show
+            word_list: Optional list of specific words to show
             k: Number of top words to use from each text if word_list is None
-            title: Title for the Sankey diagram (default: 'Text to Word Flow Analysis')
-        """
 
+        Returns:
+            Dictionary with "nodes", "source", "target" and "value" lists
+        """
         # Get words to show
+        word_list = self._query_words(word_list)
         if word_list is None:
             all_words = set()
             for label, counter in self.data["wordcount"].items():
                 top_k = [word for word, count in counter.most_common(k)]
                 all_words.update(top_k)
-            word_list = list(all_words)
+            word_list = sorted(all_words)
 
-        # Build Sankey
         labels = list(self.data["wordcount"].keys())
         nodes = labels + word_list
 
@@ -308,96 +649,301 @@ class Parsnip:
 
         for i, label in enumerate(labels):
             counter = self.data["wordcount"][label]
-            for word in word_list:
+            for j, word in enumerate(word_list):
                 count = counter.get(word, 0)
                 if count > 0:
                     sources.append(i)
-                    targets.append(len(labels) + word_list.index(word))
+                    targets.append(len(labels) + j)
                     values.append(count)
 
+        return {"nodes": nodes, "source": sources, "target": targets, "value": values}
+
+    def comparison_data(self, word_list=None, top_k=10):
+        """
+        Data behind compare_word_counts: counts of each word in each document
+
+        Args:
+            word_list: Optional list of specific words to compare
+            top_k: Number of top words to compare if word_list is None
+
+        Returns:
+            Dictionary with "words" and "counts" (label -> list of counts aligned with words)
+        """
+        word_list = self._query_words(word_list)
+        if word_list is None:
+            word_list = self.top_words(top_k)
+
+        counts = {
+            label: [counter.get(word, 0) for word in word_list]
+            for label, counter in self.data["wordcount"].items()
+        }
+        return {"words": word_list, "counts": counts}
+
+    def trend_data(self, word_list=None, top_k=5):
+        """
+        Data behind word_trend_over_time: each word's frequency across the documents in order
+
+        Args:
+            word_list: Optional list of specific words to track
+            top_k: Number of top words to track if word_list is None
+
+        Returns:
+            Dictionary with "labels" and "series" (word -> list of counts aligned with labels)
+        """
+        wordcounts = self.data["wordcount"]
+        labels = list(wordcounts.keys())
+
+        word_list = self._query_words(word_list)
+        if word_list is None:
+            word_list = self.top_words(top_k)
+
+        series = {
+            word: [wordcounts[label].get(word, 0) for label in labels] for word in word_list
+        }
+        return {"labels": labels, "series": series}
+
+    # ==== Visualization
+
+    @staticmethod
+    def _show_or_save(save_path=None):
+        """
+        Show the current matplotlib figure, or save it to disk and close it
+
+        Args:
+            save_path: Optional file path. If None, the figure is shown interactively
+        """
+        if save_path is None:
+            plt.show()
+        else:
+            plt.savefig(save_path, bbox_inches="tight")
+            plt.close()
+
+    def _display_label(self, label):
+        """Document label as shown in charts, marked if its counts are estimated from a preview"""
+        if self.data.get("approximate", {}).get(label):
+            return f"{label} (est.)"
+        return label
+
+    def _display_title(self, title):
+        """Chart title, marked if any document's counts are estimated from a preview"""
+        if any(self.data.get("approximate", {}).values()):
+            return f"{title} (estimated)"
+        return title
+
+    def word_frequency_bars(self, word_list=None, top_n=10, title=None, save_path=None):
+        """
+        Create a grid of horizontal bar charts showing top N most frequent words for each document.
+
+        Args:
+            word_list: Optional list of specific words to display. If None, shows top_n words
+            top_n: Number of top words to display for each document (default: 10)
+            title: Custom title for the overall figure (default: generic title based on top_n)
+            save_path: Optional file path to save the figure to instead of showing it
+        """
+        data = self.frequency_data(word_list, top_n)
+        num_docs = len(data)
+        cols = int(np.ceil(np.sqrt(num_docs)))
+        rows = int(np.ceil(num_docs / cols))
+        fig, axes = plt.subplots(rows, cols, figsize=(5 * cols, 4 * rows))
+        if num_docs == 1:
+            axes = [axes]
+        else:
+            axes = axes.flatten()
+        for index, (label, bars) in enumerate(data.items()):
+            axes[index].barh(bars["words"], bars["counts"])
+            axes[index].set_title(self._display_label(label))
+            axes[index].set_xlabel("Frequency")
+            axes[index].invert_yaxis()
+        for index in range(num_docs, len(axes)):
+            axes[index].set_visible(False)
+
+        # Use custom title if provided, otherwise use default
+        if title is None:
+            title = f"Top {top_n} Most Frequent Words Across Documents"
+        plt.suptitle(self._display_title(title))
+        plt.tight_layout()
+        self._show_or_save(save_path)
+
+    def wordcount_sankey(self, word_list=None, k=5, title="Text to Word Flow Analysis", save_path=None,
+                         include_plotlyjs=True):
+        """
+        Create a Sankey diagram mapping texts to words.
+        Links are passed to Plotly as NumPy arrays, which Plotly serializes as compact typed arrays.
+
+        Args:
+            word_list: Optional list of  specific words to show
+            k: Number of top words to use from each text if word_list is None
+            title: Title for the Sankey diagram (default: 'Text to Word Flow Analysis')
+            save_path: Optional file path (.html or image) to save the figure to instead of showing it
+            include_plotlyjs: How HTML exports get plotly.js. True embeds it so the file works
+                offline (default); "cdn" loads it from the web for a much smaller file
+        """
+        data = self.sankey_data(word_list, k)
+
+        # Only document nodes (listed before the word nodes) can be estimates
+        num_docs = len(self.data["wordcount"])
+        nodes = [self._display_label(node) for node in data["nodes"][:num_docs]]
+        nodes += data["nodes"][num_docs:]
+
         # Create fig
         fig = go.Figure(
             go.Sankey(
                 node=dict(label=nodes),
-                link=dict(source=sources, target=targets, value=values),
+                link=dict(
+                    source=np.asarray(data["source"], dtype=np.int32),
+                    target=np.asarray(data["target"], dtype=np.int32),
+                    value=self._link_values(data["value"]),
+                ),
             )
         )
 
-        fig.update_layout(title=title)
-        fig.show()
+        fig.update_layout(title=self._display_title(title))
+        if save_path is None:
+            fig.show()
+        elif save_path.endswith(".html"):
+            fig.write_html(save_path, include_plotlyjs=include_plotlyjs)
+        else:
+            fig.write_image(save_path)
 
-    def compare_word_counts(self, word_list=None, top_k=10, title="Word Frequency Comparison"):
+    @staticmethod
+    def _link_values(values):
+        """
+        Sankey link values as a NumPy array: int32 for integer counts that fit (typed-array
+        encoded without rounding), otherwise left as int64/float64
+        """
+        values = np.asarray(values)
+        if values.dtype.kind in "iu" and (values.size == 0 or values.max() < 2 ** 31):
+            return values.astype(np.int32)
+        return values
+
+    @staticmethod
+    def _series_colors(count):
+        """The first count colors of matplotlib's color cycle as an RGBA array, repeating as needed"""
+        cycle = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+        return to_rgba_array([cycle[i % len(cycle)] for i in range(count)])
+
+    @staticmethod
+    def _capped_legend(handles):
+        """
+        Keep legends to MAX_LEGEND_ENTRIES handles (laying out thousands is very slow),
+        with a final entry counting the ones left out
+        """
+        if len(handles) <= MAX_LEGEND_ENTRIES:
+            return handles
+        hidden = len(handles) - (MAX_LEGEND_ENTRIES - 1)
+        more = Patch(visible=False, label=f"... and {hidden} more")
+        return handles[:MAX_LEGEND_ENTRIES - 1] + [more]
+
+    @staticmethod
+    def _set_sparse_xticks(ax, positions, labels):
+        """Label at most MAX_TICK_LABELS evenly spaced ticks so thousands of labels stay legible"""
+        step = max(1, int(np.ceil(len(labels) / MAX_TICK_LABELS)))
+        ax.set_xticks(positions[::step])
+        ax.set_xticklabels(labels[::step], rotation=45, ha="right")
+
+    def compare_word_counts(self, word_list=None, top_k=10, title="Word Frequency Comparison", save_path=None):
         """
         Overlay comparison of word frequencies across all texts.
         Creates a grouped bar chart comparing word usage across documents.
+        All bars are drawn as one PolyCollection rather than one artist per bar.
 
         Args:
             word_list: Optional list of specific words to compare
             top_k: Number of top words to compare if word_list is None
             title: Custom title for the chart (default: "Word Frequency Comparison")
+            save_path: Optional file path to save the figure to instead of showing it
         """
-        wordcounts = self.data["wordcount"]
-
-        if word_list is None:
-            # Combine all counters to get overall top words
-            combined_counter = Counter()
-            for label, counter in wordcounts.items():
-                combined_counter.update(counter)
-
-            # Get the top_k most common words from the combined corpus
-            word_list = [word for word, count in combined_counter.most_common(top_k)]
-
-        labels = list(wordcounts.keys())
+        data = self.comparison_data(word_list, top_k)
+        word_list = data["words"]
+        labels = list(data["counts"].keys())
         x = np.arange(len(word_list))
         width = 0.8 / len(labels)
         fig, ax = plt.subplots(figsize=(12, 6))
 
-        for index, label in enumerate(labels):
-            counts = [wordcounts[label].get(word, 0) for word in word_list]
-            offset = (index - len(labels) / 2) * width + width / 2
-            ax.bar(x + offset, counts, width, label=label)
+        # counts[document, word]
+        counts = np.array([data["counts"][label] for label in labels], dtype=float)
+        counts = counts.reshape(len(labels), len(word_list))
+
+        # One rectangle (4 corners) per document/word, grouped around each word's x position
+        offsets = (np.arange(len(labels)) - len(labels) / 2) * width + width / 2
+        left = x[None, :] + offsets[:, None] - width / 2
+        right = left + width
+        bottom = np.zeros_like(counts)
+        corners = [(left, bottom), (left, counts), (right, counts), (right, bottom)]
+        verts = np.stack([np.stack(corner, axis=-1) for corner in corners], axis=2)
+
+        colors = self._series_colors(len(labels))
+        ax.add_collection(
+            PolyCollection(verts.reshape(-1, 4, 2), facecolors=np.repeat(colors, len(word_list), axis=0))
+        )
+        ax.autoscale_view()
+        ax.set_ylim(bottom=0)
 
         ax.set_xlabel("Words")
         ax.set_ylabel("Frequency")
-        ax.set_title(title)
+        ax.set_title(self._display_title(title))
         ax.set_xticks(x)
         ax.set_xticklabels(word_list, rotation=45, ha="right")
-        ax.legend(title="Documents", bbox_to_anchor=(1.05, 1), loc="upper left")
+        handles = [
+            Patch(color=color, label=self._display_label(label)) for label, color in zip(labels, colors)
+        ]
+        ax.legend(
+            handles=self._capped_legend(handles), title="Documents",
+            bbox_to_anchor=(1.05, 1), loc="upper left",
+        )
         plt.tight_layout()
-        plt.show()
+        self._show_or_save(save_path)
 
-    def word_trend_over_time(self, word_list=None, top_k=5, title="Word Frequency Trends Over Time"):
+    def word_trend_over_time(self, word_list=None, top_k=5, title="Word Frequency Trends Over Time", save_path=None):
         """
         Track how specific words change in frequency across documents.
         Best used with temporally ordered documents.
+        All lines are drawn as one LineCollection, and when there are more documents than the
+        plot has room for, consecutive documents are binned (averaged) down to that budget.
 
         Args:
             word_list: Optional list of specific words to track. If None, uses top_k most common words
             top_k: Number of top words to track if word_list is None (default: 5)
             title: Custom title for the chart
+            save_path: Optional file path to save the figure to instead of showing it
         """
-        wordcounts = self.data["wordcount"]
-        labels = list(wordcounts.keys())
+        data = self.trend_data(word_list, top_k)
+        labels = [self._display_label(label) for label in data["labels"]]
+        words = list(data["series"].keys())
 
-        # If word_list not provided, get top words from combined corpus
-        if word_list is None:
-            combined_counter = Counter()
-            for counter in wordcounts.values():
-                combined_counter.update(counter)
-            word_list = [word for word, count in combined_counter.most_common(top_k)]
-
-        plt.figure(figsize=(12, 6))
-
-        for word in word_list:
-            frequencies = [wordcounts[label].get(word, 0) for label in labels]
-            plt.plot(range(len(labels)), frequencies, marker='o', linewidth=2,
-                     markersize=6, label=word)
-
-        plt.xlabel("Timeline", fontsize=12)
-        plt.ylabel("Frequency", fontsize=12)
-        plt.title(title, fontsize=14)
-        plt.xticks(range(len(labels)), labels, rotation=45, ha="right")
-        plt.legend(loc="best", fontsize=10)
-        plt.grid(True, alpha=0.3)
+        # frequencies[word, document]
+        frequencies = np.array(list(data["series"].values()), dtype=float)
+        frequencies = frequencies.reshape(len(words), len(labels))
+        x = np.arange(len(labels), dtype=float)
+
+        fig, ax = plt.subplots(figsize=(12, 6))
+
+        # Bin documents when there are more of them than the pixel budget allows
+        max_points = int(fig.get_figwidth() * fig.dpi / PIXELS_PER_POINT)
+        if len(labels) > max_points:
+            edges = np.linspace(0, len(labels), max_points + 1).astype(int)[:-1]
+            sizes = np.diff(np.append(edges, len(labels)))
+            x = np.add.reduceat(x, edges) / sizes
+            frequencies = np.add.reduceat(frequencies, edges, axis=1) / sizes
+
+        colors = self._series_colors(len(words))
+        points = np.stack([np.broadcast_to(x, frequencies.shape), frequencies], axis=-1)
+        ax.add_collection(LineCollection(points, colors=colors, linewidths=2))
+        ax.scatter(
+            points[..., 0].ravel(), points[..., 1].ravel(), s=36,
+            c=np.repeat(colors, points.shape[1], axis=0), zorder=3,
+        )
+        ax.autoscale_view()
+
+        ax.set_xlabel("Timeline", fontsize=12)
+        ax.set_ylabel("Frequency", fontsize=12)
+        ax.set_title(self._display_title(title), fontsize=14)
+        self._set_sparse_xticks(ax, np.arange(len(labels)), labels)
+        handles = [
+            Line2D([], [], color=color, marker="o", linewidth=2, markersize=6, label=word)
+            for word, color in zip(words, colors)
+        ]
+        ax.legend(handles=self._capped_legend(handles), loc="best", fontsize=10)
+        ax.grid(True, alpha=0.3)
         plt.tight_layout()
-        plt.show()
+        self._show_or_save(save_path)
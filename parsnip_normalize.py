@@ -0,0 +1,147 @@
+"""
+Word Normalization for Parsnip
+DS 3500: Advance Programming with Data
+Members: Amir Sesay, Cassandra Cinzori, Ian Solberg, Iyman Mahmoud
+Group Name: The Parseltongues (Harry Potter reference :) )
+
+Optional stage between tokenization and counting that maps surface forms to a common form,
+e.g. "customers" -> "custom" (stemming) or "products" -> "product" (lemmatization), so related
+words are counted together in every chart.
+"""
+
+from collections import Counter, OrderedDict, namedtuple
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class Normalizer:
+    """
+    Memoized word normalizer.
+
+    Normalization is applied to the unique words of a wordcount Counter, not to every
+    occurrence, and each word's normalized form is kept in a bounded LRU cache so a
+    vocabulary shared across documents is only normalized once.
+
+    The cache's word -> form entries are pickled with the normalizer, so a copy sent to a
+    worker process (e.g. through a ProcessPoolExecutor initializer) arrives warm.
+    """
+
+    METHODS = ("stem", "lemma", "mapping")
+
+    def __init__(self, method="stem", mapping=None, cache_size=100_000):
+        """
+        Args:
+            method: "stem" (Porter stemmer), "lemma" (WordNet lemmatizer), "mapping",
+                or any picklable function taking and returning a word
+            mapping (dict): Word -> normalized word, used when method is "mapping".
+                Words not in the mapping are kept as they are
+            cache_size (int): Max number of words kept in the LRU cache (None for unbounded)
+        """
+        if not callable(method) and method not in self.METHODS:
+            raise ValueError(f"Unknown normalization method '{method}'. Use one of {self.METHODS}")
+        if method == "mapping" and mapping is None:
+            raise ValueError("Normalization method 'mapping' needs a mapping")
+        self.method = method
+        self.mapping = mapping
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        # Built now so a missing backend (e.g. nltk) fails here, not halfway through a load
+        self._normalize = self._build()
+
+    @classmethod
+    def from_spec(cls, spec):
+        """
+        Build a Normalizer from a manifest entry
+
+        Args:
+            spec: A method name ("stem", "lemma"), a mapping dict, or a dict with
+                "method" and optional "mapping" / "cache_size" keys
+
+        Returns:
+            Normalizer, or None if spec is empty
+        """
+        if not spec:
+            return None
+        if isinstance(spec, str):
+            return cls(spec)
+        if "method" not in spec:
+            return cls("mapping", mapping=spec)
+        return cls(spec["method"], spec.get("mapping"), spec.get("cache_size", 100_000))
+
+    def _build(self):
+        """Create the underlying (slow) normalize function for this method"""
+        if callable(self.method):
+            return self.method
+        if self.method == "mapping":
+            mapping = self.mapping
+            return lambda word: mapping.get(word, word)
+
+        try:
+            from nltk.stem import PorterStemmer, WordNetLemmatizer
+        except ImportError:
+            raise ImportError(
+                f"Normalization method '{self.method}' needs nltk: pip install nltk"
+            ) from None
+
+        if self.method == "stem":
+            return PorterStemmer().stem
+        # Lemmatizing needs the WordNet corpus: python -m nltk.downloader wordnet
+        return WordNetLemmatizer().lemmatize
+
+    def __call__(self, word):
+        """Normalize a single word, using the cache"""
+        cache = self._cache
+        if word in cache:
+            cache.move_to_end(word)
+            self.hits += 1
+            return cache[word]
+
+        self.misses += 1
+        form = self._normalize(word)
+        cache[word] = form
+        if self.cache_size is not None and len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return form
+
+    def normalize_counts(self, wordcount):
+        """
+        Normalize the keys of a wordcount, merging counts of words with the same normal form
+
+        Args:
+            wordcount (Counter): Word -> count
+
+        Returns:
+            New Counter keyed by normalized words
+        """
+        normalized = Counter()
+        for word, count in wordcount.items():
+            normalized[self(word)] += count
+        return normalized
+
+    def normalize_words(self, words):
+        """
+        Normalize a list of query words, dropping duplicates that share a normal form
+
+        Args:
+            words (list): Words as a user typed them, e.g. ["customers", "customer"]
+
+        Returns:
+            List of normalized words in first-seen order
+        """
+        return list(dict.fromkeys(self(word) for word in words))
+
+    def cache_info(self):
+        """Hit/miss statistics of the LRU cache"""
+        return CacheInfo(self.hits, self.misses, self.cache_size, len(self._cache))
+
+    def __getstate__(self):
+        # The backend (stemmer, lambda) isn't picklable and is rebuilt; the cache travels along
+        state = self.__dict__.copy()
+        del state["_normalize"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._normalize = self._build()
@@ -0,0 +1,461 @@
+"""
+Batch Pipeline: Manifest-driven entry point for Parsnip
+DS 3500: Advance Programming with Data
+Members: Amir Sesay, Cassandra Cinzori, Ian Solberg, Iyman Mahmoud
+Group Name: The Parseltongues (Harry Potter reference :) )
+
+Runs a Parsnip analysis described by a JSON manifest instead of a hand-written script.
+Stages (stop words, normalization -> documents -> charts) run as a small dependency graph,
+stages whose inputs have not changed since the last run are skipped, and chart renders run
+concurrently.
+
+Usage:
+    python parsnip_pipeline.py manifest.json [--force] [--workers N]
+
+Example manifest:
+    {
+        "cache_dir": ".parsnip_cache",
+        "stop_words": "data/stopwords.txt",
+        "normalize": "stem",
+        "documents": [
+            {"path": "data/2000_DotCom_Era.pdf", "label": "2000: Dot-Com Era", "parser": "pdf"},
+            {"path": "data/reviews.csv", "parser": "csv", "parser_options": {"text_column": "review"}}
+        ],
+        "charts": [
+            {"type": "wordcount_sankey", "output": "output/sankey.html", "options": {"k": 5}},
+            {"type": "compare_word_counts", "output": "output/compare.png", "options": {"top_k": 10}}
+        ]
+    }
+"""
+
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import hashlib
+import json
+import os
+
+from parsnip import PARSER_VERSION, Parsnip
+from parsnip_normalize import Normalizer
+
+# Manifest parser names -> Parsnip parser methods
+PARSERS = {
+    "default": "default_parser",
+    "txt": "default_parser",
+    "pdf": "pdf_parser",
+    "csv": "csv_parser",
+    "json": "json_parser",
+}
+
+# Manifest chart types -> Parsnip visualization methods
+CHARTS = {
+    "word_frequency_bars",
+    "wordcount_sankey",
+    "compare_word_counts",
+    "word_trend_over_time",
+}
+
+STATE_FILE = "state.json"
+
+
+# ==== Fingerprints
+
+def file_fingerprint(path):
+    """
+    Cheap fingerprint of a file on disk (size + modification time), like make uses
+
+    Args:
+        path (str): Path to the file
+
+    Returns:
+        String fingerprint, or "missing" if the file does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return "missing"
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def digest(*parts):
+    """Stable hash of any JSON-serializable values"""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# ==== Stage graph
+
+class Stage:
+    """
+    One node of the pipeline graph.
+
+    A stage's key is a hash of its own inputs plus the keys of the stages it depends on,
+    so a change anywhere upstream invalidates everything downstream of it.
+    """
+
+    def __init__(self, name, inputs, deps=(), outputs=()):
+        self.name = name
+        self.inputs = inputs
+        self.deps = list(deps)
+        self.outputs = list(outputs)
+        self.key = None
+
+    def compute_key(self, stages):
+        """Hash this stage's inputs together with its dependencies' keys"""
+        dep_keys = [stages[dep].key for dep in self.deps]
+        self.key = digest(self.name, self.inputs, dep_keys)
+        return self.key
+
+    def is_fresh(self, state):
+        """A stage can be skipped if its key matches the last run and its outputs still exist"""
+        return state.get(self.name) == self.key and all(
+            os.path.exists(path) for path in self.outputs
+        )
+
+
+def topological_order(stages):
+    """
+    Order stages so every stage comes after its dependencies
+
+    Args:
+        stages (dict): Stage name -> Stage
+
+    Returns:
+        List of stage names
+    """
+    order = []
+    visiting = set()
+    done = set()
+
+    def visit(name):
+        if name in done:
+            return
+        if name in visiting:
+            raise ValueError(f"Cycle in pipeline graph at stage '{name}'")
+        visiting.add(name)
+        for dep in stages[name].deps:
+            visit(dep)
+        visiting.discard(name)
+        done.add(name)
+        order.append(name)
+
+    for name in stages:
+        visit(name)
+    return order
+
+
+# ==== Manifest
+
+def load_manifest(path):
+    """
+    Read and validate a pipeline manifest
+
+    Args:
+        path (str): Path to the JSON manifest
+
+    Returns:
+        Manifest dictionary with defaults filled in
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        manifest = json.load(file)
+
+    # Relative paths in the manifest are relative to the manifest itself
+    base = os.path.dirname(os.path.abspath(path))
+
+    def resolve(p):
+        return p if os.path.isabs(p) else os.path.join(base, p)
+
+    manifest.setdefault("cache_dir", ".parsnip_cache")
+    manifest["cache_dir"] = resolve(manifest["cache_dir"])
+    if manifest.get("stop_words"):
+        manifest["stop_words"] = resolve(manifest["stop_words"])
+
+    labels = set()
+    for doc in manifest.setdefault("documents", []):
+        doc["path"] = resolve(doc["path"])
+        doc.setdefault("label", os.path.basename(doc["path"]))
+        doc.setdefault("parser", "default")
+        doc.setdefault("parser_options", {})
+        if doc["parser"] not in PARSERS:
+            raise ValueError(f"Unknown parser '{doc['parser']}' for {doc['path']}")
+        if doc["label"] in labels:
+            raise ValueError(f"Duplicate document label '{doc['label']}'")
+        labels.add(doc["label"])
+
+    outputs = set()
+    for chart in manifest.setdefault("charts", []):
+        if chart.get("type") not in CHARTS:
+            raise ValueError(f"Unknown chart type '{chart.get('type')}'")
+        if "output" not in chart:
+            raise ValueError(f"Chart '{chart['type']}' has no output path")
+        chart["output"] = resolve(chart["output"])
+        chart.setdefault("options", {})
+        if chart["output"] in outputs:
+            raise ValueError(f"Duplicate chart output '{chart['output']}'")
+        outputs.add(chart["output"])
+
+    return manifest
+
+
+def build_graph(manifest):
+    """
+    Turn a manifest into a graph of stages
+
+    Args:
+        manifest (dict): Manifest from load_manifest
+
+    Returns:
+        Dictionary of stage name -> Stage, in dependency order
+    """
+    stages = {}
+
+    stop_words = manifest.get("stop_words")
+    stages["stop_words"] = Stage(
+        "stop_words", [stop_words, file_fingerprint(stop_words) if stop_words else None]
+    )
+    stages["normalize"] = Stage("normalize", [manifest.get("normalize")])
+
+    doc_names = []
+    for doc in manifest["documents"]:
+        name = f"doc:{doc['label']}"
+        # The parser version invalidates cached output when the parsers themselves change
+        stages[name] = Stage(
+            name,
+            [doc["path"], file_fingerprint(doc["path"]), doc["parser"], doc["parser_options"],
+             PARSER_VERSION],
+        )
+        doc_names.append(name)
+
+    for chart in manifest["charts"]:
+        # Keyed by output path so reordering the manifest doesn't re-render anything
+        name = chart_stage_name(chart)
+        stages[name] = Stage(
+            name,
+            [chart["type"], chart["options"], chart["output"]],
+            deps=["stop_words", "normalize"] + doc_names,
+            outputs=[chart["output"]],
+        )
+
+    for name in topological_order(stages):
+        stages[name].compute_key(stages)
+    return stages
+
+
+def chart_stage_name(chart):
+    """Stage name of a chart spec"""
+    return f"chart:{chart['output']}"
+
+
+# ==== Parse cache
+
+def _cache_path(cache_dir, stage):
+    return os.path.join(cache_dir, "docs", f"{stage.key}.json")
+
+
+def _prune_cache(cache_dir, stages):
+    """Delete cached parser output that no current document stage points to"""
+    docs_dir = os.path.join(cache_dir, "docs")
+    if not os.path.isdir(docs_dir):
+        return
+    current = {
+        f"{stage.key}.json" for name, stage in stages.items() if name.startswith("doc:")
+    }
+    for entry in os.listdir(docs_dir):
+        if entry.endswith(".json") and entry not in current:
+            os.remove(os.path.join(docs_dir, entry))
+
+
+def parse_document(parsnip, doc, cache_dir, stage):
+    """
+    Parse one document, reusing the cached parser output when the stage is unchanged.
+    The cache holds raw parser output, so stop word or normalization changes never force a re-parse.
+
+    Returns:
+        Tuple of (parser results, whether they came from the cache)
+    """
+    path = _cache_path(cache_dir, stage)
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as file:
+            results = json.load(file)
+        results["wordcount"] = Counter(results.get("wordcount", {}))
+        return results, True
+
+    parser = getattr(parsnip, PARSERS[doc["parser"]])
+    results = parser(doc["path"], **doc["parser_options"])
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file)
+    return results, False
+
+
+def build_parsnip(manifest, stages=None, verbose=True):
+    """
+    Load stop words and every document in the manifest into a Parsnip instance,
+    using the parse cache for unchanged documents
+
+    Args:
+        manifest (dict): Manifest from load_manifest
+        stages (dict): Optional pre-built stage graph
+        verbose (bool): Print which documents were parsed or reused
+
+    Returns:
+        Loaded Parsnip instance
+    """
+    if stages is None:
+        stages = build_graph(manifest)
+
+    parsnip = Parsnip()
+    if manifest.get("stop_words"):
+        parsnip.load_stop_words(manifest["stop_words"])
+    parsnip.set_normalizer(Normalizer.from_spec(manifest.get("normalize")))
+
+    for doc in manifest["documents"]:
+        stage = stages[f"doc:{doc['label']}"]
+        results, cached = parse_document(parsnip, doc, manifest["cache_dir"], stage)
+        if verbose and cached:
+            print(f"Skipped {doc['path']}: unchanged")
+        # Hand the (possibly cached) results to load_text through its parser hook
+        parsnip.load_text(doc["path"], label=doc["label"], parser=lambda _, r=results: r)
+
+    return parsnip
+
+
+# ==== Chart rendering
+
+# Normalizer of the corpus being charted, set once per worker process by _init_chart_worker
+_worker_normalizer = None
+
+
+def _init_chart_worker(normalizer):
+    """
+    Process pool initializer: keep the parent's normalizer for every chart this worker renders.
+    It's pickled along with its cache, so workers start with the corpus vocabulary already normalized.
+    """
+    global _worker_normalizer
+    _worker_normalizer = normalizer
+
+
+def render_chart(data, stop_words, chart):
+    """
+    Render a single chart in a worker process
+
+    Args:
+        data (dict): Snapshot of Parsnip.data
+        stop_words (list): Stop words already applied to data
+        chart (dict): Chart spec from the manifest
+
+    Returns:
+        Output path of the rendered chart
+    """
+    import matplotlib.pyplot as plt
+
+    # Workers never open windows
+    plt.switch_backend("Agg")
+
+    parsnip = Parsnip()
+    parsnip.data = defaultdict(dict, data)
+    parsnip.stop_words = stop_words
+    # Chart word lists are normalized like the counts in data
+    parsnip.normalizer = _worker_normalizer
+
+    os.makedirs(os.path.dirname(chart["output"]) or ".", exist_ok=True)
+    getattr(parsnip, chart["type"])(save_path=chart["output"], **chart["options"])
+    return chart["output"]
+
+
+# ==== Runner
+
+def _load_state(cache_dir):
+    try:
+        with open(os.path.join(cache_dir, STATE_FILE), "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_state(cache_dir, state):
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(os.path.join(cache_dir, STATE_FILE), "w", encoding="utf-8") as file:
+        json.dump(state, file, indent=2)
+
+
+def run_pipeline(manifest_path, force=False, workers=None):
+    """
+    Run every stale stage of the manifest's pipeline
+
+    Args:
+        manifest_path (str): Path to the JSON manifest
+        force (bool): Re-run every stage even if its inputs are unchanged
+        workers (int): Max number of concurrent chart renders (default: one per CPU)
+
+    Returns:
+        List of chart output paths that were (re)rendered
+    """
+    manifest = load_manifest(manifest_path)
+    stages = build_graph(manifest)
+    cache_dir = manifest["cache_dir"]
+    state = {} if force else _load_state(cache_dir)
+
+    charts = {chart_stage_name(chart): chart for chart in manifest["charts"]}
+    stale = [name for name in charts if not stages[name].is_fresh(state)]
+    for name in charts:
+        if name not in stale:
+            print(f"Skipped {name}: unchanged")
+
+    if not stale:
+        print("Nothing to do.")
+        return []
+
+    # Documents are only parsed (or pulled from the parse cache) when a chart needs them
+    if force:
+        for name, stage in stages.items():
+            if name.startswith("doc:") and os.path.exists(_cache_path(cache_dir, stage)):
+                os.remove(_cache_path(cache_dir, stage))
+    parsnip = build_parsnip(manifest, stages)
+    data = {k: dict(v) for k, v in parsnip.data.items()}
+
+    rendered = []
+    failed = []
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_chart_worker, initargs=(parsnip.normalizer,)
+    ) as pool:
+        futures = {
+            name: pool.submit(render_chart, data, parsnip.stop_words, charts[name])
+            for name in stale
+        }
+        for name, future in futures.items():
+            try:
+                rendered.append(future.result())
+                print(f"Rendered {name} -> {charts[name]['output']}")
+            except Exception as e:
+                print(f"Error rendering {name}: {e}")
+                failed.append(name)
+
+    # Failed charts keep their old key so the next run retries them;
+    # stages no longer in the manifest are dropped
+    state = {name: key for name, key in state.items() if name in stages}
+    for name, stage in stages.items():
+        if name in charts and (name not in stale or name in failed):
+            continue
+        state[name] = stage.key
+    _save_state(cache_dir, state)
+    _prune_cache(cache_dir, stages)
+
+    if failed:
+        raise RuntimeError(f"{len(failed)} chart(s) failed to render: {', '.join(failed)}")
+    return rendered
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Run a manifest-driven Parsnip pipeline")
+    arg_parser.add_argument("manifest", help="Path to the JSON pipeline manifest")
+    arg_parser.add_argument("--force", action="store_true", help="Ignore the cache and re-run every stage")
+    arg_parser.add_argument("--workers", type=int, default=None, help="Max concurrent chart renders")
+    args = arg_parser.parse_args()
+
+    run_pipeline(args.manifest, force=args.force, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
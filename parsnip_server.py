@@ -0,0 +1,278 @@
+"""
+Query Server: Keeps a parsed Parsnip corpus warm in memory
+DS 3500: Advance Programming with Data
+Members: Amir Sesay, Cassandra Cinzori, Ian Solberg, Iyman Mahmoud
+Group Name: The Parseltongues (Harry Potter reference :) )
+
+Optional long-lived local server that loads a corpus once (from a pipeline manifest) and
+answers chart data queries as JSON, so analyses don't pay start-up and parsing costs each time.
+Listens on 127.0.0.1 or on a Unix socket only; it never binds to an external interface.
+
+Usage:
+    python parsnip_server.py amazon_manifest.json [--port 8765 | --socket /tmp/parsnip.sock]
+
+Endpoints (GET, parameters in the query string; lists are comma separated):
+    /topk?k=10                     Top k words across the corpus
+    /frequency?top_n=10&words=...  Per-document word counts (word_frequency_bars)
+    /trend?top_k=5&words=...       Word frequencies across documents (word_trend_over_time)
+    /compare?top_k=10&words=...    Word counts per document (compare_word_counts)
+    /sankey?k=5&words=...          Sankey nodes and links (wordcount_sankey)
+    /documents                     Loaded document labels, word totals and whether they are estimates
+
+    POST /load with a JSON body {"path": ..., "label": ..., "parser": "pdf"} adds a document.
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+from urllib.parse import urlencode, urlparse, parse_qs
+import argparse
+import http.client
+import json
+import os
+import socket
+import stat
+import threading
+
+from parsnip import Parsnip
+from parsnip_pipeline import PARSERS, build_parsnip, load_manifest
+
+
+class UnknownEndpoint(Exception):
+    """Raised for requests to an endpoint the server doesn't have"""
+
+
+class CorpusService:
+    """
+    Thread-safe wrapper around a loaded Parsnip instance.
+    Query results are cached per (endpoint, parameters) and dropped whenever documents change.
+    """
+
+    def __init__(self, parsnip):
+        self.parsnip = parsnip
+        self.lock = threading.Lock()
+        self.cache = {}
+        self.cache_version = parsnip.version
+
+    # Endpoint -> (Parsnip method, {query parameter: (method argument, type)})
+    QUERIES = {
+        "topk": ("top_words", {"k": ("k", int)}),
+        "frequency": ("frequency_data", {"words": ("word_list", list), "top_n": ("top_n", int)}),
+        "trend": ("trend_data", {"words": ("word_list", list), "top_k": ("top_k", int)}),
+        "compare": ("comparison_data", {"words": ("word_list", list), "top_k": ("top_k", int)}),
+        "sankey": ("sankey_data", {"words": ("word_list", list), "k": ("k", int)}),
+    }
+
+    def query(self, endpoint, params):
+        """
+        Answer a chart data query, from the cache when possible
+
+        Args:
+            endpoint (str): Name of the query (see QUERIES)
+            params (dict): Query string parameters, name -> string value
+
+        Returns:
+            JSON-serializable result
+        """
+        if endpoint == "documents":
+            with self.lock:
+                return {
+                    label: {
+                        "numwords": self.parsnip.data["numwords"].get(label),
+                        "approximate": self.parsnip.data.get("approximate", {}).get(label, False),
+                    }
+                    for label in self.parsnip.data["wordcount"]
+                }
+
+        if endpoint not in self.QUERIES:
+            raise UnknownEndpoint(endpoint)
+        method, spec = self.QUERIES[endpoint]
+
+        kwargs = {}
+        for name, value in params.items():
+            if name not in spec:
+                raise ValueError(f"Unknown parameter '{name}' for /{endpoint}")
+            arg, kind = spec[name]
+            kwargs[arg] = [w for w in value.split(",") if w] if kind is list else kind(value)
+
+        key = (endpoint, tuple(sorted((k, str(v)) for k, v in kwargs.items())))
+        with self.lock:
+            if self.cache_version != self.parsnip.version:
+                self.cache.clear()
+                self.cache_version = self.parsnip.version
+            if key not in self.cache:
+                self.cache[key] = getattr(self.parsnip, method)(**kwargs)
+            return self.cache[key]
+
+    def load(self, path, label=None, parser="default", parser_options=None):
+        """
+        Parse and add a document to the corpus, invalidating cached query results
+
+        Returns:
+            Label the document was stored under
+        """
+        if parser not in PARSERS:
+            raise ValueError(f"Unknown parser '{parser}'")
+        parse = getattr(self.parsnip, PARSERS[parser])
+        # Parse outside the lock so queries keep being served meanwhile
+        results = parse(path, **(parser_options or {}))
+        label = label or path
+        with self.lock:
+            self.parsnip.load_text(path, label=label, parser=lambda _: results)
+        return label
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+    """HTTP handler that routes requests to the server's CorpusService"""
+
+    def address_string(self):
+        # Unix socket clients have no (host, port) address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "local"
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        endpoint = url.path.strip("/")
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        try:
+            self._reply(200, self.server.service.query(endpoint, params))
+        except UnknownEndpoint:
+            self._reply(404, {"error": f"Unknown endpoint '/{endpoint}'"})
+        except (ValueError, TypeError) as e:
+            self._reply(400, {"error": str(e)})
+        except Exception as e:
+            self._reply(500, {"error": f"Internal error: {e}"})
+
+    def do_POST(self):
+        if urlparse(self.path).path.strip("/") != "load":
+            self._reply(404, {"error": f"Unknown endpoint '{self.path}'"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            label = self.server.service.load(
+                body["path"],
+                label=body.get("label"),
+                parser=body.get("parser", "default"),
+                parser_options=body.get("parser_options"),
+            )
+            self._reply(200, {"loaded": label})
+        except (KeyError, ValueError, TypeError, OSError) as e:
+            self._reply(400, {"error": f"Could not load document: {e}"})
+        except Exception as e:
+            self._reply(500, {"error": f"Internal error: {e}"})
+
+
+class UnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    """Threaded HTTP server listening on a Unix domain socket"""
+
+    daemon_threads = True
+
+
+def make_server(service, port=8765, socket_path=None):
+    """
+    Create a local query server for a CorpusService
+
+    Args:
+        service (CorpusService): Service holding the loaded corpus
+        port (int): TCP port on 127.0.0.1 (ignored if socket_path is given)
+        socket_path (str): Optional Unix socket path to listen on instead of TCP
+
+    Returns:
+        Server instance, ready for serve_forever()
+    """
+    if socket_path is not None:
+        # Replace a stale socket from an earlier run, but never any other kind of file
+        if os.path.exists(socket_path):
+            if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+                raise FileExistsError(f"{socket_path} exists and is not a socket")
+            os.remove(socket_path)
+        server = UnixHTTPServer(socket_path, QueryHandler)
+    else:
+        server = ThreadingHTTPServer(("127.0.0.1", port), QueryHandler)
+    server.service = service
+    return server
+
+
+# ==== Client
+
+class _UnixConnection(http.client.HTTPConnection):
+    """HTTPConnection that talks to a Unix socket instead of a TCP port"""
+
+    def __init__(self, socket_path):
+        super().__init__("localhost")
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.socket_path)
+
+
+def query(endpoint, port=8765, socket_path=None, body=None, **params):
+    """
+    Query a running Parsnip server
+
+    Args:
+        endpoint (str): Endpoint name, e.g. "topk" or "load"
+        port (int): Server port on 127.0.0.1
+        socket_path (str): Unix socket path, if the server listens on one
+        body (dict): Optional JSON body; sends a POST instead of a GET
+        **params: Query parameters; lists are sent comma separated
+
+    Returns:
+        Decoded JSON response
+    """
+    params = {k: ",".join(v) if isinstance(v, (list, tuple)) else v for k, v in params.items()}
+    path = f"/{endpoint}" + (f"?{urlencode(params)}" if params else "")
+
+    if socket_path is not None:
+        connection = _UnixConnection(socket_path)
+    else:
+        connection = http.client.HTTPConnection("127.0.0.1", port)
+    try:
+        if body is None:
+            connection.request("GET", path)
+        else:
+            connection.request(
+                "POST", path, json.dumps(body), {"Content-Type": "application/json"}
+            )
+        response = connection.getresponse()
+        result = json.loads(response.read())
+    finally:
+        connection.close()
+
+    if response.status != 200:
+        raise RuntimeError(result.get("error", f"HTTP {response.status}"))
+    return result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Serve Parsnip chart data queries from a warm corpus")
+    arg_parser.add_argument("manifest", nargs="?", help="Pipeline manifest with the documents to load")
+    arg_parser.add_argument("--port", type=int, default=8765, help="Port on 127.0.0.1 (default: 8765)")
+    arg_parser.add_argument("--socket", default=None, help="Listen on this Unix socket instead of TCP")
+    args = arg_parser.parse_args()
+
+    parsnip = build_parsnip(load_manifest(args.manifest)) if args.manifest else Parsnip()
+    server = make_server(CorpusService(parsnip), port=args.port, socket_path=args.socket)
+
+    where = args.socket or f"http://127.0.0.1:{args.port}"
+    print(f"Serving {len(parsnip.data['wordcount'])} documents on {where}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.socket and os.path.exists(args.socket):
+            os.remove(args.socket)
+
+
+if __name__ == "__main__":
+    main()